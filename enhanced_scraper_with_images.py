@@ -1,8 +1,10 @@
 #enhanced_scraper_with_images.py
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-from typing import List, Dict
+from typing import List, Dict, Optional, Callable
 from urllib.parse import urljoin
 import time
 from pathlib import Path
@@ -59,8 +61,19 @@ class EnhancedNewsExtractorWithImages:
 }
          
         self.downloaded_image_hashes = set()
+        self.session = self.create_session()
         self.setup_output_directory()
 
+    def create_session(self) -> requests.Session:
+        """Pooled keep-alive session shared by page and image downloads"""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                              max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     def setup_output_directory(self):
         """Setup simplified output directory structure"""
         self.output_dir = Path('./output')
@@ -179,7 +192,7 @@ class EnhancedNewsExtractorWithImages:
         news_list = []
         try:
             print(f"Scraping {source_name} for {source_config.get('category', 'general')} news...")
-            response = requests.get(source_config['url'], headers=self.headers, timeout=15)
+            response = self.session.get(source_config['url'], timeout=15)
             if response.status_code != 200:
                 print(f"{source_name}: Status {response.status_code} - Skipping")
                 return news_list
@@ -336,7 +349,7 @@ class EnhancedNewsExtractorWithImages:
 
     def download_image_unique(self, image_url: str, filename: str) -> str:
         try:
-            response = requests.get(image_url, headers=self.headers, timeout=10)
+            response = self.session.get(image_url, timeout=10)
             if response.status_code == 200:
                 image_content = response.content
                 if len(image_content) < 1000:
@@ -361,15 +374,18 @@ class EnhancedNewsExtractorWithImages:
             pass
         return None
 
-    def get_all_news(self) -> Dict[str, List[Dict]]:
-        """Get news organized by categories - GUARANTEED 10 per category"""
+    def get_all_news(self, progress_cb: Optional[Callable[[float, str], None]] = None) -> Dict[str, List[Dict]]:
+        """Get news organized by categories - GUARANTEED 10 per category, reporting (fraction, message) to progress_cb"""
         print("Starting categorized news extraction (GUARANTEED 10 per category)...")
         all_news = []
+        total_sources = len(self.news_sources)
         
         # Scrape from all sources
-        for source_name, config in self.news_sources.items():
+        for i, (source_name, config) in enumerate(self.news_sources.items(), 1):
             news_data = self.scrape_single_source_with_images(source_name, config)
             all_news.extend(news_data)
+            if progress_cb:
+                progress_cb(i / total_sources, f"Scraped {source_name} ({i}/{total_sources})")
             time.sleep(random.uniform(0.3, 0.8))  # Faster scraping
         
         # Remove duplicates
@@ -442,10 +458,7 @@ class EnhancedNewsExtractorWithImages:
         today = datetime.now().strftime('%Y-%m-%d_%H-%M')
         
         total_articles = sum(len(articles) for articles in categorized_news.values())
-        total_images = 0
-        
-        for articles in categorized_news.values():
-            total_images += len([a for a in articles if a.get('image_path')])
+        total_images = sum(1 for articles in categorized_news.values() for a in articles if a.get('image_path'))
         
         json_data = {
             'timestamp': datetime.now().isoformat(),
@@ -469,7 +482,7 @@ class EnhancedNewsExtractorWithImages:
         
         print(f"\nFINAL CATEGORY BREAKDOWN:")
         for category, articles in categorized_news.items():
-            images_count = len([a for a in articles if a.get('image_path')])
+            images_count = sum(1 for a in articles if a.get('image_path'))
             print(f"  {category.upper()}: {len(articles)} articles, {images_count} with images")
         
         return str(json_file)
@@ -2,7 +2,7 @@
 
 import json
 import requests
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable
 import random
 import google.generativeai as genai
 import os
@@ -11,6 +11,7 @@ from supabase import create_client, Client
 import time
 import hashlib
 from pathlib import Path
+from collections import OrderedDict
 from datetime import datetime
 import re
 import glob
@@ -67,6 +68,43 @@ class NewsToMemeProcessor:
         
         # Load emotions from database
         self.emotions_db = self.load_emotions_from_supabase()
+        
+        # Template rows per emotion_id as (fetched_at, rows), refreshed after template_cache_ttl seconds
+        self.template_cache_ttl = 600
+        self.templates_by_emotion = {}
+        self.fallback_templates = (0.0, [])
+        
+        # Processed memes by article URL, persisted so reruns skip Gemini for known articles
+        self.processed_cache_path = Path('./output/processed_memes_cache.json')
+        self.max_cached_articles = 500
+        self.processed_cache = self.load_processed_cache()
+        
+        # Articles sent to Gemini in the latest process_all_news_articles run (cache hits excluded)
+        self.last_run_gemini_calls = 0
+
+    def load_processed_cache(self) -> "OrderedDict[str, Dict]":
+        """Load the article URL -> processed meme cache from disk, least recently used first"""
+        try:
+            if self.processed_cache_path.exists():
+                with open(self.processed_cache_path, 'r', encoding='utf-8') as f:
+                    cache = OrderedDict(json.load(f))
+                print(f"Loaded {len(cache)} cached processed articles")
+                return cache
+        except Exception as e:
+            print(f"Error loading processed cache: {e}")
+        return OrderedDict()
+
+    def save_processed_cache(self):
+        """Persist the processed meme cache, keeping only the most recently used articles"""
+        try:
+            while len(self.processed_cache) > self.max_cached_articles:
+                self.processed_cache.popitem(last=False)
+            
+            self.processed_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.processed_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self.processed_cache, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Error saving processed cache: {e}")
 
     def find_latest_news_json(self, output_directory: str = './output') -> str:
         """Automatically find the latest news JSON file from scraper"""
@@ -146,7 +184,7 @@ class NewsToMemeProcessor:
                     warnings.simplefilter("ignore")
                     response = model.generate_content(prompt)
                 
-                time.sleep(3)  # Rate limiting delay
+                # Rate limiting is enforced per key by get_next_available_key_index
                 return response.text.strip()
                 
             except Exception as e:
@@ -213,6 +251,31 @@ class NewsToMemeProcessor:
         
         return emotions_list[0] if emotions_list else ""
 
+    def get_templates_for_emotion(self, emotion_id) -> List[Dict]:
+        """Template rows for an emotion_id, reused across articles until template_cache_ttl expires"""
+        fetched_at, templates = self.templates_by_emotion.get(emotion_id, (0.0, []))
+        if templates and time.time() - fetched_at < self.template_cache_ttl:
+            return templates
+        
+        response = self.supabase.schema('dc').table('memes_dc').select('*').eq('emotion_id', emotion_id).execute()
+        templates = response.data or []
+        # Empty answers aren't cached so a newly added or briefly unavailable emotion is retried
+        if templates:
+            self.templates_by_emotion[emotion_id] = (time.time(), templates)
+        return templates
+
+    def get_fallback_templates(self) -> List[Dict]:
+        """Sample of any templates, used when no emotion matches; cached like get_templates_for_emotion"""
+        fetched_at, templates = self.fallback_templates
+        if templates and time.time() - fetched_at < self.template_cache_ttl:
+            return templates
+        
+        response = self.supabase.schema('dc').table('memes_dc').select('*').limit(10).execute()
+        templates = response.data or []
+        if templates:
+            self.fallback_templates = (time.time(), templates)
+        return templates
+
     def get_template_from_supabase_smart(self, detected_emotion: str) -> str:
         """Get meme template from Supabase with exact or nearest emotion matching"""
         try:
@@ -220,10 +283,10 @@ class NewsToMemeProcessor:
             if detected_emotion in self.emotions_db:
                 emotion_id = self.emotions_db[detected_emotion]['emotion_id']
                 
-                response = self.supabase.schema('dc').table('memes_dc').select('*').eq('emotion_id', emotion_id).execute()
+                templates = self.get_templates_for_emotion(emotion_id)
                 
-                if response.data:
-                    selected_template = random.choice(response.data)
+                if templates:
+                    selected_template = random.choice(templates)
                     image_path = selected_template.get('image_path', '')
                     return image_path
             
@@ -234,18 +297,18 @@ class NewsToMemeProcessor:
             if nearest_emotion and nearest_emotion != detected_emotion:
                 emotion_id = self.emotions_db[nearest_emotion]['emotion_id']
                 
-                response = self.supabase.schema('dc').table('memes_dc').select('*').eq('emotion_id', emotion_id).execute()
+                templates = self.get_templates_for_emotion(emotion_id)
                 
-                if response.data:
-                    selected_template = random.choice(response.data)
+                if templates:
+                    selected_template = random.choice(templates)
                     image_path = selected_template.get('image_path', '')
                     return image_path
             
             # If still no match, get any available template
-            response = self.supabase.schema('dc').table('memes_dc').select('*').limit(10).execute()
+            templates = self.get_fallback_templates()
             
-            if response.data:
-                selected_template = random.choice(response.data)
+            if templates:
+                selected_template = random.choice(templates)
                 image_path = selected_template.get('image_path', '')
                 return image_path
             else:
@@ -521,8 +584,10 @@ Return EVERYTHING in this JSON format only:
             print(f"Error loading news from JSON: {e}")
             return []
 
-    def process_all_news_articles(self) -> List[Dict]:
-        """Process ALL articles from the latest JSON file"""
+    def process_all_news_articles(self, progress_cb: Optional[Callable[[float, str], None]] = None,
+                                  result_cb: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """Process ALL articles from the latest JSON file, reporting (fraction, message) to progress_cb
+        and handing each finished meme to result_cb as soon as it is ready"""
         
         json_file_path = self.find_latest_news_json()
         
@@ -539,6 +604,8 @@ Return EVERYTHING in this JSON format only:
         
         processed_news = []
         total_articles = len(articles)
+        cache_changed = False
+        self.last_run_gemini_calls = 0
         
         print(f"\nSARCASTIC NEWS PROCESSING STARTED")
         print(f"Processing ALL {total_articles} articles")
@@ -551,14 +618,32 @@ Return EVERYTHING in this JSON format only:
             print(f"Content: {article['content'][:80]}...")
             
             try:
-                # SINGLE COMPREHENSIVE API CALL per article
-                result = self.process_single_news_sarcastic(
-                    article['content'], 
-                    article.get('url', '')
-                )
+                article_url = article.get('url', '')
+                cached = self.processed_cache.get(article_url) if article_url else None
+                
+                if cached and cached.get('template_image_path'):
+                    # Already processed in an earlier run, no Gemini call needed
+                    self.processed_cache.move_to_end(article_url)
+                    cache_changed = True
+                    result = dict(cached)
+                    print(f"Using cached result for article {i}")
+                else:
+                    # SINGLE COMPREHENSIVE API CALL per article
+                    self.last_run_gemini_calls += 1
+                    result = self.process_single_news_sarcastic(
+                        article['content'], 
+                        article_url
+                    )
+                    # A missing template may be a transient Supabase failure, so only complete results are kept
+                    if result and article_url and result.get('template_image_path'):
+                        self.processed_cache[article_url] = dict(result)
+                        self.processed_cache.move_to_end(article_url)
+                        cache_changed = True
                 
                 if result:
                     processed_news.append(result)
+                    if result_cb:
+                        result_cb(result)
                     print(f"SUCCESS! Article {i} processed")
                     print(f"   Category: {result['category']}")
                     print(f"   Template: {'Yes' if result['template_image_path'] else 'No'}")
@@ -573,6 +658,11 @@ Return EVERYTHING in this JSON format only:
             # Show progress
             success_rate = (len(processed_news) / i) * 100
             print(f"Progress: {i}/{total_articles} | Success: {len(processed_news)} ({success_rate:.1f}%)")
+            if progress_cb:
+                progress_cb(i / total_articles, f"Processed article {i}/{total_articles}")
+        
+        if cache_changed:
+            self.save_processed_cache()
         
         return processed_news
 
@@ -630,7 +720,7 @@ if __name__ == "__main__":
             print(f"URL: {sample['url']}")
             print(f"Template: {sample['template_image_path']}")
             
-        templates_found = len([p for p in processed_news if p['template_image_path']])
+        templates_found = sum(1 for p in processed_news if p['template_image_path'])
         print(f"\nSTATS:")
         print(f"   Articles processed: {len(processed_news)}")
         print(f"   Templates found: {templates_found}")
@@ -72,7 +72,8 @@ def complete_news_pipeline():
         print("\nSTEP 1: Scraping categorized news (10 per category)...")
         categorized_news = news_extractor.get_all_news()
         
-        if not categorized_news:
+        # Every category can come back empty: nothing to save or hand to Gemini
+        if not categorized_news or not any(categorized_news.values()):
             raise HTTPException(
                 status_code=404,
                 detail="No news articles could be scraped from any source"
@@ -83,9 +84,7 @@ def complete_news_pipeline():
         
         # Calculate scraped stats
         total_scraped = sum(len(articles) for articles in categorized_news.values())
-        total_images = 0
-        for articles in categorized_news.values():
-            total_images += len([a for a in articles if a.get('image_path')])
+        total_images = sum(1 for articles in categorized_news.values() for a in articles if a.get('image_path'))
         
         print(f"\nScraping Results:")
         print(f"  Total articles: {total_scraped}")
@@ -108,9 +107,12 @@ def complete_news_pipeline():
         # Save processed memes
         memes_json_file = meme_processor.save_processed_news(processed_memes)
         
+        total_processed = len(processed_memes)
+        processing_success_rate = total_processed / total_scraped * 100 if total_scraped else 0.0
+        
         print(f"\nProcessing Results:")
-        print(f"  Articles processed: {len(processed_memes)}")
-        print(f"  Success rate: {(len(processed_memes)/total_scraped*100):.1f}%")
+        print(f"  Articles processed: {total_processed}")
+        print(f"  Success rate: {processing_success_rate:.1f}%")
         print(f"  Saved to: {memes_json_file}")
         
         # =====================================================
@@ -118,8 +120,9 @@ def complete_news_pipeline():
         # =====================================================
         
         # Calculate processing stats
-        templates_found = len([m for m in processed_memes if m.get('template_image_path')])
-        categories_processed = list(set([m.get('category', 'unknown') for m in processed_memes]))
+        templates_found = sum(1 for m in processed_memes if m.get('template_image_path'))
+        categories_processed = sorted({m.get('category', 'unknown') for m in processed_memes})
+        template_success_rate = templates_found / total_processed * 100 if total_processed else 0.0
         
         # Flatten categorized news for response consistency
         flat_scraped_news = []
@@ -145,14 +148,14 @@ def complete_news_pipeline():
                     "scraping_method": "High-buzz selection, 10 per category"
                 },
                 "processing": {
-                    "articles_processed": len(processed_memes),
+                    "articles_processed": total_processed,
                     "templates_matched": templates_found,
-                    "template_success_rate": f"{(templates_found/len(processed_memes)*100):.1f}%" if processed_memes else "0%",
+                    "template_success_rate": f"{template_success_rate:.1f}%",
                     "categories_generated": categories_processed,
-                    "gemini_api_calls": len(processed_memes),
+                    "gemini_api_calls": meme_processor.last_run_gemini_calls,
                     "processing_method": "Single comprehensive call per article"
                 },
-                "overall_success_rate": f"{(len(processed_memes)/total_scraped*100):.1f}%" if total_scraped > 0 else "0%"
+                "overall_success_rate": f"{processing_success_rate:.1f}%"
             },
             
             # OUTPUT FILES
@@ -176,7 +179,7 @@ def complete_news_pipeline():
             
             # PROCESSED MEMES DATA  
             "processed_memes_data": {
-                "total_memes": len(processed_memes),
+                "total_memes": total_processed,
                 "fields_per_meme": ["description", "category", "hashtags", "dialogues", "url", "template_image_path"],
                 "memes": processed_memes
             },
@@ -209,8 +212,8 @@ def complete_news_pipeline():
         
         print(f"\n" + "="*80)
         print("PIPELINE COMPLETE!")
-        print(f"SUCCESS: {total_scraped} articles scraped → {len(processed_memes)} memes generated")
-        print(f"Templates matched: {templates_found}/{len(processed_memes)} ({(templates_found/len(processed_memes)*100):.1f}%)")
+        print(f"SUCCESS: {total_scraped} articles scraped → {total_processed} memes generated")
+        print(f"Templates matched: {templates_found}/{total_processed} ({template_success_rate:.1f}%)")
         print("="*80)
         
         return JSONResponse(content=complete_response)
@@ -2,10 +2,11 @@ import gradio as gr
 import json
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageDraw, ImageFont
 import textwrap
 from io import BytesIO
-import base64
 from datetime import datetime
 import time
 import random
@@ -15,6 +16,15 @@ import logging
 from dotenv import load_dotenv
 import threading
 import queue
+import atexit
+import contextvars
+import gc
+import hashlib
+import html
+import re
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Load environment variables
 load_dotenv()
@@ -33,6 +43,308 @@ except ImportError:
     print("Please ensure enhanced_scraper_with_images.py and gemini_emotion_processor.py are in the same directory")
     exit()
 
+# Related images render at 80px; 200px covers high-DPI screens with headroom
+THUMBNAIL_DIR = Path('./output/thumbnails')
+THUMBNAIL_SIZE = (200, 200)
+
+# Generated static assets (content-hashed stylesheets) served through Gradio's file route
+STATIC_DIR = Path('./output/static')
+
+# Rendered memes are written here once and served to the browser as static files
+MEMES_DIR = Path('./output/memes')
+
+# Post images display at most 614px wide (.meme-card); 2x covers high-DPI screens
+POST_IMAGE_MAX_SIZE = (1228, 1228)
+
+# Minimum gap between streamed feed updates (20 fps); faster arrivals are batched
+STREAM_MIN_INTERVAL = 0.05
+
+# Cards rendered per page of the feed; "Show More" reveals the next page
+MEMES_PAGE_SIZE = 10
+
+# Gradio serves files from allowed_paths under /file= (moved to /gradio_api/file= in Gradio 5)
+GRADIO_FILE_ROUTE = "/gradio_api/file=" if int(gr.__version__.split('.')[0]) >= 5 else "/file="
+
+def _minify_css(css):
+    """Strip comments, collapse whitespace and drop redundant semicolons from a stylesheet"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>~])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+def gradio_file_url(local_path):
+    """URL under which Gradio serves a local file listed in allowed_paths"""
+    return f"{GRADIO_FILE_ROUTE}{Path(local_path).as_posix()}"
+
+# Static HTML blocks, built once at import
+EMPTY_FEED_HTML = """
+<div class="empty-state">
+    <div style="text-align: center; padding: 4rem; color: #666;">
+        <h3>No memes available</h3>
+        <p>Click "🎭 Generate Memes" to start creating amazing content!</p>
+    </div>
+</div>
+"""
+
+MAIN_HEADER_HTML = """
+<div class="main-header">
+    <h1 class="main-title">📱 MemeGram</h1>
+    <p class="main-subtitle">AI-powered viral memes from latest Indian news</p>
+</div>
+"""
+
+GENERATE_HEADING_HTML = """
+<div class="section-heading">
+    <h2>🚀 Generate Your Viral Content</h2>
+</div>
+"""
+
+FILTER_HEADING_HTML = """
+<div class="section-heading">
+    <h3>📂 Filter by Category</h3>
+</div>
+"""
+
+# Card markup, formatted once per card; related-images block only when thumbnails exist
+MEME_CARD_TEMPLATE = """
+        <div class="meme-card">
+            <!-- Post Header -->
+            <div class="post-header">
+                <div class="profile-info">
+                    <div class="profile-avatar">🎭</div>
+                    <div>
+                        <div class="username">MemeGram</div>
+                        <div class="location">{status_badge}</div>
+                    </div>
+                </div>
+                <div class="menu-dots">⋯</div>
+            </div>
+            
+            <!-- 1. Main Image/Template -->
+            <div class="post-image-container">
+                {image_html}
+            </div>
+            
+            <!-- Post Actions -->
+            <div class="post-actions">
+                <div class="action-buttons">
+                    <span class="action-btn">❤️</span>
+                    <span class="action-btn">💬</span>
+                    <span class="action-btn">📤</span>
+                </div>
+                <span class="action-btn bookmark">🔖</span>
+            </div>
+            
+            <!-- 2. Description -->
+            <div class="post-content">
+                <div class="likes">❤️ {likes} likes</div>
+                <div class="caption">
+                    <span class="username">memegram</span> 
+                    <span class="description-text">{description_html}</span>
+                </div>
+                
+                <!-- 3. Read More News Link -->
+                {news_link_html}
+                
+                <!-- 4. Hashtags -->
+                <div class="hashtags">
+                    {hashtags_html}
+                </div>
+                
+                <!-- 5. Related Images Mini Block -->
+                {related_images_html}
+                
+                <!-- Timestamp -->
+                <div class="timestamp">{timestamp} • See translation</div>
+            </div>
+        </div>
+        """
+
+RELATED_IMAGES_TEMPLATE = """
+                <details class="related-images-mini">
+                    <summary class="related-title">📸 Show Related News Images</summary>
+                    <div class="mini-images-grid">
+                        {related_images_content}
+                    </div>
+                </details>
+                """
+
+READY_STATUS_HTML = '<div class="status-message">🎯 Ready to generate amazing Instagram-style memes!</div>'
+
+# Shared pool for image decode/resize so a card's images are prepared concurrently
+IMAGE_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="meme-img")
+
+# Network-bound template downloads release the GIL, so this pool can be wider than IMAGE_POOL
+FETCH_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="meme-fetch")
+
+# Decoded remote images kept across renders (templates repeat across memes and regenerations)
+REMOTE_IMAGE_CACHE_SIZE = 128
+# One freshness window for every template-derived layer (decoded image, downloaded file, rendered
+# meme): a template replaced upstream is re-downloaded within the hour, and cards already rendered
+# from the old copy are redrawn at most one window after that
+REMOTE_IMAGE_TTL = 3600  # seconds
+REMOTE_IMAGE_MAX_BYTES = 8 * 1024 * 1024
+# Failed template URLs aren't retried for this long, so a dead link can't stall every feed update
+FAILED_IMAGE_TTL = 120  # seconds
+
+# Downloaded template files, kept on disk (for REMOTE_IMAGE_TTL) so restarts skip the network
+TEMPLATE_CACHE_DIR = Path('./output/templates')
+
+# File URLs of rendered memes keyed by (template_path, dialogues); makes category switches re-render free
+RENDERED_CACHE_SIZE = 256
+
+@lru_cache(maxsize=512)
+def _url_for(image_path, base_url):
+    """Map a stored image path to a URL or local path (pure, no filesystem access)"""
+    if image_path.startswith('http://') or image_path.startswith('https://'):
+        return image_path
+    
+    if image_path.startswith('storage/'):
+        return f"{base_url}{image_path}"
+    
+    if image_path.startswith('output/') or image_path.startswith('./output/'):
+        return image_path.replace('./', '')
+    
+    if image_path.startswith('/'):
+        return f"{base_url.rstrip('/')}{image_path}"
+    
+    return None
+
+def _post_canvas_size(width, height):
+    """Size an image is drawn and stored at: shrunk to fit POST_IMAGE_MAX_SIZE, never enlarged"""
+    scale = min(1.0, POST_IMAGE_MAX_SIZE[0] / width, POST_IMAGE_MAX_SIZE[1] / height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+_existing_local_paths = set()
+
+def _local_exists(local_path):
+    """os.path.exists that remembers hits; misses are re-checked so freshly scraped files show up"""
+    if local_path in _existing_local_paths:
+        return True
+    if os.path.exists(local_path):
+        _existing_local_paths.add(local_path)
+        return True
+    return False
+
+def _fresh_mtime(path):
+    """(mtime, mtime_ns) of a cached file younger than REMOTE_IMAGE_TTL, or None if missing or stale"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    if time.time() - stat.st_mtime >= REMOTE_IMAGE_TTL:
+        return None
+    return stat.st_mtime, stat.st_mtime_ns
+
+def _decode_rgb(img):
+    """Fully decode an opened image as RGB, no larger than needed for the post canvas"""
+    # Every consumer shrinks to at most the post canvas, so JPEGs well above it can use libjpeg's
+    # 1/2-1/8 DCT scaling; draft() ignores other formats and images already near canvas size
+    img.draft('RGB', _post_canvas_size(*img.size))
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+    img.load()
+    return img
+
+# Entries are decoded full-size images, so keep only the working set of templates
+@lru_cache(maxsize=32)
+def _open_local_image(local_path, mtime_ns):
+    """Decode a local image once per (path, mtime); callers must copy before drawing on it"""
+    return _decode_rgb(Image.open(local_path))
+
+FONT_PATHS = (
+    "arial.ttf",
+    "/System/Library/Fonts/Arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+)
+
+# Serializes text layout/drawing on the shared cached fonts when cards render in parallel
+CAPTION_LOCK = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _resolve_font_path():
+    """First loadable caption font, probed once per process"""
+    for font_path in FONT_PATHS:
+        try:
+            ImageFont.truetype(font_path, 12)
+            return font_path
+        except OSError:
+            continue
+    return None
+
+@lru_cache(maxsize=32)
+def _get_font(font_path, size):
+    """Shared FreeType face per (path, size)"""
+    return ImageFont.truetype(font_path, size)
+
+def _caption_font_size(img_width, img_height):
+    """Caption font size for a template of the given dimensions"""
+    return max(16, min(img_width // 25, img_height // 20, 48))
+
+@lru_cache(maxsize=32)
+def _line_height(font_path, size):
+    """Caption line height for a font size (glyph 'A' height plus 4px leading)"""
+    bbox = _get_font(font_path, size).getbbox("A")
+    return bbox[3] - bbox[1] + 4
+
+def _text_width(font, text):
+    """Rendered width of text in a (bitmap fallback) font"""
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0]
+
+@lru_cache(maxsize=4096)
+def _cached_text_length(font_path, size, text):
+    """Advance width of text for a cached face (additive across words, unlike bbox width)"""
+    return _get_font(font_path, size).getlength(text)
+
+def _text_length(font, text):
+    """Advance width of text in font, memoized for TrueType faces"""
+    if isinstance(font, ImageFont.FreeTypeFont) and isinstance(font.path, str):
+        return _cached_text_length(font.path, font.size, text)
+    return font.getlength(text)
+
+TELUGU_CONTEXTS = (
+    'tollywood', 'hyderabad', 'telangana', 'andhra', 'vijay', 'prabhas', 
+    'mahesh', 'allu arjun', 'ram charan', 'chiranjeevi', 'balakrishna',
+    'nagarjuna', 'venkatesh', 'ravi teja', 'ntr', 'pawan kalyan'
+)
+
+# Word-bounded so short names like 'ntr' don't fire inside 'country' or 'central'
+TELUGU_CONTEXT_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, TELUGU_CONTEXTS)) + r')\b', re.IGNORECASE)
+
+TNGLISH_PATTERNS = {
+    "when": "eppudu",
+    "everyone": "andaru", 
+    "meanwhile": "antha sepu",
+    "me": "nenu",
+    "that moment": "aa moment",
+    "literally": "literally",
+    "waiting": "wait chestunna",
+    "watching": "chustunna",
+    "thinking": "anukuntunna",
+    "feeling": "feel avutunna",
+    "people": "vallu",
+    "this": "idhi",
+    "that": "adhi",
+    "now": "ippudu",
+    "always": "eppuduu",
+    "what": "enti",
+    "why": "enduku",
+    "how": "ela"
+}
+
+# One pass over the lowercased dialogue; longest phrase first so "that moment" wins over "that"
+TNGLISH_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, sorted(TNGLISH_PATTERNS, key=len, reverse=True))) + r')\b'
+)
+
+@lru_cache(maxsize=1024)
+def _has_telugu_context(text):
+    """Memoized Telugu-context check shared by all is_tnglish callers"""
+    return TELUGU_CONTEXT_RE.search(text) is not None
+
 class GradioMemeGenerator:
     def __init__(self):
         """Initialize the meme generator with proper URL handling"""
@@ -45,24 +357,40 @@ class GradioMemeGenerator:
         
         self.processed_memes = []
         self.all_memes = []  # Store all memes
-        self.categorized_news_data = {}
+        self.memes_by_category = {}  # Title-cased category -> memes, built once per generation
+        self.related_images_index = {}  # article url -> related image paths, rebuilt per generation
         self.generation_queue = queue.Queue()
+        self.generation_lock = threading.Lock()
         self.is_generating = False
         self.available_categories = []
         self.current_category = "All"
+        self.visible_count = MEMES_PAGE_SIZE
+        self.feed_html_cache = {}  # (category, visible_count) -> feed HTML, cleared whenever memes change
+        
+        # Pooled keep-alive session so repeated Supabase image fetches skip the TCP/TLS handshake
+        self.http = requests.Session()
+        self.http.headers.update({'Connection': 'keep-alive'})
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+        )
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+        atexit.register(self.http.close)
+        
+        self.remote_image_cache = OrderedDict()  # url -> (fetched_at wall-clock, decoded RGB image), LRU-bounded
+        self.remote_image_lock = threading.Lock()
+        self.remote_inflight = {}  # url -> Event set when the thread downloading it finishes
+        self.failed_images = {}  # url -> time of the last failed download
+        self.rendered_cache = OrderedDict()  # (template_path, dialogues) -> (file mtime, versioned URL), LRU-bounded
+        self.rendered_lock = threading.Lock()
         
         print(f"Supabase base URL: {self.supabase_image_base_url}")
     
     def is_tnglish(self, text):
         """Check if text should be in Tnglish"""
-        telugu_contexts = [
-            'tollywood', 'hyderabad', 'telangana', 'andhra', 'vijay', 'prabhas', 
-            'mahesh', 'allu arjun', 'ram charan', 'chiranjeevi', 'balakrishna',
-            'nagarjuna', 'venkatesh', 'ravi teja', 'ntr', 'pawan kalyan'
-        ]
-        
-        text_lower = text.lower()
-        return any(context in text_lower for context in telugu_contexts)
+        return _has_telugu_context(text)
     
     def construct_image_url(self, image_path):
         """Construct proper image URL based on path type"""
@@ -70,25 +398,11 @@ class GradioMemeGenerator:
             if not image_path:
                 return None
             
-            if image_path.startswith('http://') or image_path.startswith('https://'):
-                return image_path
-            
-            if image_path.startswith('storage/'):
-                full_url = f"{self.supabase_image_base_url}{image_path}"
-                return full_url
-            
-            if image_path.startswith('output/') or image_path.startswith('./output/'):
-                local_path = image_path.replace('./', '')
-                if os.path.exists(local_path):
-                    return local_path
-                else:
-                    return None
-            
-            if image_path.startswith('/'):
-                full_url = f"{self.supabase_image_base_url.rstrip('/')}{image_path}"
-                return full_url
+            url = _url_for(image_path, self.supabase_image_base_url)
+            if url and not url.startswith('http') and not _local_exists(url):
+                return None
             
-            return None
+            return url
             
         except Exception as e:
             print(f"Error constructing URL for {image_path}: {e}")
@@ -102,11 +416,8 @@ class GradioMemeGenerator:
             
             if image_path.startswith('output/') or image_path.startswith('./output/'):
                 local_path = image_path.replace('./', '')
-                if os.path.exists(local_path):
-                    img = Image.open(local_path)
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    return img
+                if _local_exists(local_path):
+                    return _open_local_image(local_path, os.stat(local_path).st_mtime_ns)
                 else:
                     return None
             
@@ -115,132 +426,221 @@ class GradioMemeGenerator:
                 return None
             
             if not url.startswith('http'):
-                if os.path.exists(url):
-                    img = Image.open(url)
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    return img
+                if _local_exists(url):
+                    return _open_local_image(url, os.stat(url).st_mtime_ns)
                 return None
             
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                img = Image.open(BytesIO(response.content))
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                return img
-            else:
-                return None
+            with self.remote_image_lock:
+                cached = self.remote_image_cache.get(url)
+                if cached is not None:
+                    fetched_at, cached_img = cached
+                    if time.time() - fetched_at < REMOTE_IMAGE_TTL:
+                        self.remote_image_cache.move_to_end(url)
+                        return cached_img
+                    del self.remote_image_cache[url]
+                failed_at = self.failed_images.get(url)
+                if failed_at is not None:
+                    if time.time() - failed_at < FAILED_IMAGE_TTL:
+                        return None
+                    del self.failed_images[url]
+                # Concurrent requests for the same URL wait on the first download instead of repeating it
+                inflight = self.remote_inflight.get(url)
+                if inflight is None:
+                    self.remote_inflight[url] = threading.Event()
+            
+            if inflight is not None:
+                inflight.wait()
+                with self.remote_image_lock:
+                    cached = self.remote_image_cache.get(url)
+                return cached[1] if cached else None
+            
+            fetched = None
+            try:
+                fetched = self.fetch_remote_image(url)
+                if fetched is None:
+                    return None
+                with self.remote_image_lock:
+                    self.remote_image_cache[url] = fetched
+                    if len(self.remote_image_cache) > REMOTE_IMAGE_CACHE_SIZE:
+                        self.remote_image_cache.popitem(last=False)
+                return fetched[1]
+            finally:
+                with self.remote_image_lock:
+                    if fetched is None:
+                        self.failed_images[url] = time.time()
+                    self.remote_inflight.pop(url).set()
                 
         except Exception as e:
             print(f"Error loading image from {image_path}: {e}")
             return None
     
+    def fetch_remote_image(self, url):
+        """(fetched_at, decoded RGB image) for a remote URL, from the on-disk template cache or the network;
+        fetched_at is wall-clock time so a file reused from disk keeps its original age"""
+        cache_path = TEMPLATE_CACHE_DIR / hashlib.sha1(url.encode()).hexdigest()
+        cache_mtime = _fresh_mtime(cache_path)
+        
+        if cache_mtime:
+            fetched_at = cache_mtime[0]
+            img = _open_local_image(str(cache_path), cache_mtime[1])
+        else:
+            fetched_at = time.time()
+            # Stream with a size cap so an oversized upstream file can't balloon memory
+            with self.http.get(url, timeout=10, stream=True) as response:
+                if response.status_code != 200:
+                    return None
+                data = response.raw.read(REMOTE_IMAGE_MAX_BYTES + 1, decode_content=True)
+            if len(data) > REMOTE_IMAGE_MAX_BYTES:
+                print(f"Skipping image larger than {REMOTE_IMAGE_MAX_BYTES // (1024 * 1024)}MB: {url}")
+                return None
+            
+            img = _decode_rgb(Image.open(BytesIO(data)))
+            try:
+                TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # Templates are fetched in parallel, so write a per-thread temp file and swap it in
+                temp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+                temp_path.write_bytes(data)
+                os.replace(temp_path, cache_path)
+            except OSError as e:
+                print(f"Could not cache template {url}: {e}")
+        
+        return fetched_at, img
+    
+    def prefetch_template_images(self, memes):
+        """Download the unique templates for a batch of memes in parallel before rendering"""
+        unique_paths = set()
+        for meme in memes:
+            template_path = meme.get('template_image_path')
+            if not template_path:
+                continue
+            if '_processed_dialogues' not in meme:
+                self.precompute_display_fields(meme)
+            # Memes rendered to disk within the freshness window don't need their template
+            if not _fresh_mtime(self.rendered_meme_path(template_path, meme['_processed_dialogues'])):
+                unique_paths.add(template_path)
+        # Results land in the image caches; load_image_from_path already logs failures
+        images = list(FETCH_POOL.map(self.load_image_from_path, unique_paths))
+        
+        # Warm the font cache for the caption sizes this batch will need
+        font_path = _resolve_font_path()
+        if font_path:
+            with CAPTION_LOCK:
+                for size in {_caption_font_size(*_post_canvas_size(*img.size)) for img in images if img}:
+                    _get_font(font_path, size)
+                    _line_height(font_path, size)
+    
+    def get_thumbnail_path(self, image_path):
+        """Return a small WebP display copy of an image on disk, creating it on first use"""
+        try:
+            url = self.construct_image_url(image_path)
+            if not url:
+                return None
+            
+            cache_key = url
+            if not url.startswith('http'):
+                cache_key = f"{url}:{os.stat(url).st_mtime_ns}"
+            thumb_path = THUMBNAIL_DIR / f"{hashlib.sha1(cache_key.encode()).hexdigest()}.webp"
+            
+            if thumb_path.exists():
+                return str(thumb_path)
+            
+            img = self.load_image_from_path(image_path)
+            if not img:
+                return None
+            
+            thumb = img.copy()
+            thumb.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+            THUMBNAIL_DIR.mkdir(parents=True, exist_ok=True)
+            # Thumbnails are built from the image pool, so swap in a per-thread temp file atomically
+            temp_path = thumb_path.with_name(f"{thumb_path.name}.{threading.get_ident()}.tmp")
+            thumb.save(temp_path, format="WEBP", quality=80)
+            os.replace(temp_path, thumb_path)
+            return str(thumb_path)
+            
+        except Exception as e:
+            print(f"Error creating thumbnail for {image_path}: {e}")
+            return None
+    
     def wrap_text_to_fit(self, text, font, draw, max_width):
         """Wrap text to fit within max_width, breaking into multiple lines"""
         words = text.split()
+        
+        # Measure each word once and sum widths greedily instead of re-measuring the growing line
+        space_width = _text_length(font, " ")
+        word_widths = [_text_length(font, word) for word in words]
+        
         lines = []
-        current_line = ""
+        current_words = []
+        current_width = 0
         
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
+        for word, word_width in zip(words, word_widths):
+            candidate_width = current_width + (space_width if current_words else 0) + word_width
             
-            try:
-                bbox = draw.textbbox((0, 0), test_line, font=font)
-                text_width = bbox[2] - bbox[0]
-            except:
-                text_width = len(test_line) * (font.size * 0.6)
-            
-            if text_width <= max_width:
-                current_line = test_line
+            if candidate_width <= max_width:
+                current_words.append(word)
+                current_width = candidate_width
             else:
-                if current_line:
-                    lines.append(current_line)
-                    current_line = word
+                if current_words:
+                    lines.append(" ".join(current_words))
+                    current_words = [word]
+                    current_width = word_width
                 else:
                     lines.append(word)
-                    current_line = ""
+                    current_width = 0
         
-        if current_line:
-            lines.append(current_line)
+        if current_words:
+            lines.append(" ".join(current_words))
         
         return lines
     
     def overlay_text_on_image(self, image_path, dialogues):
-        """Enhanced text overlay with proper wrapping and positioning"""
+        """Enhanced text overlay with proper wrapping and positioning (dialogues are drawn as given)"""
         try:
             img = self.load_image_from_path(image_path)
             if not img:
                 return None
             
+            # Draw on a copy so cached source images stay clean; oversized templates are
+            # shrunk to the stored size first so captions rasterize on the smaller canvas
+            canvas_size = _post_canvas_size(*img.size)
+            if canvas_size != img.size:
+                img = img.resize(canvas_size, Image.Resampling.LANCZOS)
+            else:
+                img = img.copy()
             draw = ImageDraw.Draw(img)
             img_width, img_height = img.size
             
-            base_font_size = max(16, min(img_width // 25, img_height // 20, 48))
+            base_font_size = _caption_font_size(img_width, img_height)
             
-            font = None
-            font_paths = [
-                "arial.ttf",
-                "/System/Library/Fonts/Arial.ttf",
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-                "C:/Windows/Fonts/arial.ttf",
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            ]
-            
-            for font_path in font_paths:
-                try:
-                    font = ImageFont.truetype(font_path, base_font_size)
-                    break
-                except:
-                    continue
-            
-            if not font:
+            font_path = _resolve_font_path()
+            if font_path:
+                font = _get_font(font_path, base_font_size)
+            else:
                 font = ImageFont.load_default()
                 base_font_size = max(12, min(img_width // 30, img_height // 25, 36))
             
-            if len(dialogues) >= 2:
-                top_text = dialogues[0].upper()
-                bottom_text = dialogues[1].upper()
+            # FreeType faces are shared between card threads and are not safe to use concurrently
+            with CAPTION_LOCK:
+                if len(dialogues) >= 2:
+                    top_text, bottom_text = dialogues[0], dialogues[1]
                 
-                max_text_width = int(img_width * 0.8)
+                    max_text_width = int(img_width * 0.8)
                 
-                top_lines = self.wrap_text_to_fit(top_text, font, draw, max_text_width)
+                    top_lines = self.wrap_text_to_fit(top_text, font, draw, max_text_width)
                 
-                try:
-                    sample_bbox = draw.textbbox((0, 0), "A", font=font)
-                    line_height = sample_bbox[3] - sample_bbox[1] + 4
-                except:
-                    line_height = base_font_size + 4
-                
-                top_start_y = max(15, img_height // 20)
-                
-                for i, line in enumerate(top_lines):
-                    try:
-                        bbox = draw.textbbox((0, 0), line, font=font)
-                        line_width = bbox[2] - bbox[0]
-                    except:
-                        line_width = len(line) * (base_font_size * 0.6)
-                    
-                    line_x = (img_width - line_width) // 2
-                    line_y = top_start_y + (i * line_height)
-                    
-                    self.draw_text_with_enhanced_outline(draw, (line_x, line_y), line, font)
+                    if font_path:
+                        line_height = _line_height(font_path, base_font_size)
+                    else:
+                        line_height = base_font_size + 4
                 
-                bottom_lines = self.wrap_text_to_fit(bottom_text, font, draw, max_text_width)
-                total_bottom_height = len(bottom_lines) * line_height
+                    top_start_y = max(15, img_height // 20)
+                    self.draw_caption_lines(draw, top_lines, font, img_width // 2, top_start_y, line_height)
                 
-                bottom_start_y = img_height - total_bottom_height - max(15, img_height // 20)
+                    bottom_lines = self.wrap_text_to_fit(bottom_text, font, draw, max_text_width)
+                    total_bottom_height = len(bottom_lines) * line_height
                 
-                for i, line in enumerate(bottom_lines):
-                    try:
-                        bbox = draw.textbbox((0, 0), line, font=font)
-                        line_width = bbox[2] - bbox[0]
-                    except:
-                        line_width = len(line) * (base_font_size * 0.6)
-                    
-                    line_x = (img_width - line_width) // 2
-                    line_y = bottom_start_y + (i * line_height)
-                    
-                    self.draw_text_with_enhanced_outline(draw, (line_x, line_y), line, font)
+                    bottom_start_y = img_height - total_bottom_height - max(15, img_height // 20)
+                    self.draw_caption_lines(draw, bottom_lines, font, img_width // 2, bottom_start_y, line_height)
             
             return img
             
@@ -248,126 +648,156 @@ class GradioMemeGenerator:
             print(f"Error overlaying text on {image_path}: {e}")
             return None
     
-    def draw_text_with_enhanced_outline(self, draw, position, text, font, text_color='white', outline_color='black', outline_width=3):
+    def draw_caption_lines(self, draw, lines, font, center_x, start_y, line_height):
+        """Draw caption lines horizontally centered on center_x, one line_height apart"""
+        # TrueType faces center in C via the middle-ascender anchor; only bitmap fallbacks need a width
+        anchored = isinstance(font, ImageFont.FreeTypeFont)
+        for i, line in enumerate(lines):
+            line_y = start_y + i * line_height
+            if anchored:
+                self.draw_text_with_enhanced_outline(draw, (center_x, line_y), line, font, anchor='ma')
+            else:
+                line_x = center_x - _text_width(font, line) // 2
+                self.draw_text_with_enhanced_outline(draw, (line_x, line_y), line, font)
+    
+    def draw_text_with_enhanced_outline(self, draw, position, text, font, text_color='white', outline_color='black', outline_width=3, anchor=None):
         """Draw text with enhanced outline for better visibility"""
-        x, y = position
-        
-        for dx in range(-outline_width, outline_width + 1):
-            for dy in range(-outline_width, outline_width + 1):
-                if dx != 0 or dy != 0:
-                    draw.text((x + dx, y + dy), text, font=font, fill=outline_color)
-        
-        draw.text(position, text, font=font, fill=text_color)
+        # Pillow strokes the outline in the same rasterization pass (one FreeType layout, not 49)
+        draw.text(position, text, font=font, fill=text_color, stroke_width=outline_width, stroke_fill=outline_color, anchor=anchor)
     
-    def generate_tnglish_dialogues(self, english_dialogues, context):
-        """Convert to Tnglish if Telugu context detected"""
-        if not self.is_tnglish(context):
+    def generate_tnglish_dialogues(self, english_dialogues, context, is_tnglish=None):
+        """Convert to Tnglish if Telugu context detected (pass is_tnglish when already known)"""
+        if is_tnglish is None:
+            is_tnglish = self.is_tnglish(context)
+        if not is_tnglish:
             return english_dialogues
         
-        tnglish_patterns = {
-            "when": "eppudu",
-            "everyone": "andaru", 
-            "meanwhile": "antha sepu",
-            "me": "nenu",
-            "that moment": "aa moment",
-            "literally": "literally",
-            "waiting": "wait chestunna",
-            "watching": "chustunna",
-            "thinking": "anukuntunna",
-            "feeling": "feel avutunna",
-            "people": "vallu",
-            "this": "idhi",
-            "that": "adhi",
-            "now": "ippudu",
-            "always": "eppuduu",
-            "what": "enti",
-            "why": "enduku",
-            "how": "ela"
-        }
-        
-        tnglish_dialogues = []
-        for dialogue in english_dialogues:
-            tnglish_version = dialogue.lower()
-            for eng, tel in tnglish_patterns.items():
-                tnglish_version = tnglish_version.replace(eng, tel)
-            tnglish_dialogues.append(tnglish_version.capitalize())
+        tnglish_dialogues = [
+            TNGLISH_RE.sub(lambda match: TNGLISH_PATTERNS[match.group(0)], dialogue.lower()).capitalize()
+            for dialogue in english_dialogues
+        ]
         
         return tnglish_dialogues
     
-    def find_related_images(self, news_index):
-        """Find related images for a specific news item"""
-        try:
-            if hasattr(self, 'categorized_news_data') and self.categorized_news_data:
-                # Get all articles in order
-                all_articles = []
-                for category, articles in self.categorized_news_data.items():
-                    for article in articles:
-                        article['scraped_category'] = category
-                        all_articles.append(article)
-                
-                if news_index < len(all_articles):
-                    article = all_articles[news_index]
-                    images = []
-                    
-                    # Get the original scraped image if available
-                    if article.get('image_path'):
-                        images.append(article['image_path'])
-                    
-                    return images
-            
-            return []
-        except Exception as e:
-            print(f"Error finding related images: {e}")
-            return []
+    def build_related_images_index(self, categorized_news):
+        """Map each scraped article URL to its related image paths, once per generation"""
+        self.related_images_index = {
+            article['url']: [article['image_path']]
+            for articles in categorized_news.values()
+            for article in articles
+            if article.get('url') and article.get('image_path')
+        }
+    
+    def find_related_images(self, article_url):
+        """Find related images for the article a meme was generated from"""
+        return self.related_images_index.get(article_url, [])
+    
+    def save_post_image(self, img, output_path):
+        """Write a post image as WebP, shrunk to the card's display size"""
+        canvas_size = _post_canvas_size(*img.size)
+        if canvas_size != img.size:
+            img = img.resize(canvas_size, Image.Resampling.LANCZOS)
+        MEMES_DIR.mkdir(parents=True, exist_ok=True)
+        # Cards render concurrently, so write to a per-thread temp file and swap it in atomically
+        temp_path = output_path.with_name(f"{output_path.name}.{threading.get_ident()}.tmp")
+        img.save(temp_path, format="WEBP", quality=80, method=4)
+        os.replace(temp_path, output_path)
+    
+    def precompute_display_fields(self, meme_data):
+        """Attach render-ready fields to a meme once, at generation time"""
+        description = meme_data.get('description', 'No description available')
+        dialogues = meme_data.get('dialogues', [])
+        context = description + ' ' + str(dialogues)
+        meme_data['_is_tnglish'] = self.is_tnglish(context)
+        if meme_data['_is_tnglish']:
+            dialogues = self.generate_tnglish_dialogues(dialogues, context, is_tnglish=True)
+        # Caption lines exactly as drawn on the template (max 8 words each, upper-cased)
+        meme_data['_processed_dialogues'] = tuple(' '.join(dialogue.split()[:8]).upper() for dialogue in dialogues[:2])
+        meme_data['_description_html'] = html.escape(description).replace('\n', '<br>')
+        url = meme_data.get('url', '')
+        # Seeded by article URL (or its text when there is none) so a meme keeps its like count
+        # across filters, pages and reruns without URL-less memes all sharing one count
+        like_seed = url or description + '|' + '|'.join(map(str, dialogues))
+        meme_data['_likes'] = random.Random(like_seed).randint(100, 2000)
+        meme_data['_timestamp'] = datetime.now().strftime('%B %d')
+        meme_data['_news_link_html'] = (
+            f'<div class="news-link"><a href="{html.escape(url)}" target="_blank">🔗 Read full news article</a></div>'
+            if url else ''
+        )
+        meme_data['_hashtags_html'] = " ".join([
+            f'<span class="hashtag">#{html.escape(str(tag).replace("#", ""))}</span>'
+            for tag in meme_data.get('hashtags', [])[:8]
+        ])
+        return meme_data
+    
+    def rendered_meme_path(self, template_path, processed_dialogues):
+        """On-disk location of a rendered meme for a template and caption lines"""
+        key = '|'.join((template_path,) + tuple(processed_dialogues))
+        return MEMES_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.webp"
+    
+    def get_rendered_image_src(self, template_path, processed_dialogues):
+        """File URL of the captioned meme (or bare template on failure), rendered once per template and dialogues"""
+        key = (template_path, tuple(processed_dialogues))
+        with self.rendered_lock:
+            cached = self.rendered_cache.get(key)
+            if cached is not None:
+                rendered_at, image_src = cached
+                if time.time() - rendered_at < REMOTE_IMAGE_TTL:
+                    self.rendered_cache.move_to_end(key)
+                    return image_src
+                del self.rendered_cache[key]
+        
+        meme_path = self.rendered_meme_path(template_path, processed_dialogues)
+        if not _fresh_mtime(meme_path):
+            meme_image = self.overlay_text_on_image(template_path, processed_dialogues)
+            if meme_image:
+                self.save_post_image(meme_image, meme_path)
+            else:
+                # Fall back to the bare template; cached under this card's key so the failing
+                # overlay isn't retried on every re-render
+                meme_path = MEMES_DIR / f"{hashlib.sha1(template_path.encode()).hexdigest()}.webp"
+                if not _fresh_mtime(meme_path):
+                    original_template = self.load_image_from_path(template_path)
+                    if not original_template:
+                        return None
+                    self.save_post_image(original_template, meme_path)
+        
+        # The version query makes browsers fetch a re-rendered file instead of their cached copy
+        meme_stat = os.stat(meme_path)
+        image_src = f"{gradio_file_url(meme_path)}?v={meme_stat.st_mtime_ns}"
+        with self.rendered_lock:
+            self.rendered_cache[key] = (meme_stat.st_mtime, image_src)
+            self.rendered_cache.move_to_end(key)
+            if len(self.rendered_cache) > RENDERED_CACHE_SIZE:
+                self.rendered_cache.popitem(last=False)
+        return image_src
     
     def generate_meme_card_html(self, meme_data, index):
         """Generate single meme card HTML"""
-        # Get template path and dialogues
+        # Get template path and link
         template_path = meme_data.get('template_image_path', '')
-        dialogues = meme_data.get('dialogues', [])
-        description = meme_data.get('description', 'No description available')
-        hashtags = meme_data.get('hashtags', [])
         url = meme_data.get('url', '')
         category = meme_data.get('category', 'Unknown').title()
         
-        # Language detection
-        context = description + ' ' + str(dialogues)
-        is_tnglish = self.is_tnglish(context)
-        
-        if is_tnglish:
-            dialogues = self.generate_tnglish_dialogues(dialogues, context)
+        if '_description_html' not in meme_data:
+            self.precompute_display_fields(meme_data)
         
-        # Process dialogues (max 8 words each)
-        processed_dialogues = []
-        for dialogue in dialogues[:2]:
-            words = dialogue.split()[:8]
-            processed_dialogues.append(' '.join(words))
+        # Language detection and caption lines (precomputed at generation time)
+        is_tnglish = meme_data['_is_tnglish']
+        processed_dialogues = meme_data['_processed_dialogues']
         
         # Create meme image
-        meme_image = None
         image_html = ""
         if template_path and processed_dialogues:
-            meme_image = self.overlay_text_on_image(template_path, processed_dialogues)
-            if meme_image:
-                # Convert PIL image to base64 for HTML display
-                buffered = BytesIO()
-                meme_image.save(buffered, format="PNG")
-                img_str = base64.b64encode(buffered.getvalue()).decode()
-                image_html = f'<img src="data:image/png;base64,{img_str}" class="post-image" />'
-            else:
-                original_template = self.load_image_from_path(template_path)
-                if original_template:
-                    buffered = BytesIO()
-                    original_template.save(buffered, format="PNG")
-                    img_str = base64.b64encode(buffered.getvalue()).decode()
-                    image_html = f'<img src="data:image/png;base64,{img_str}" class="post-image" />'
+            image_src = self.get_rendered_image_src(template_path, processed_dialogues)
+            if image_src:
+                # Only the first post is above the fold; the rest load as they scroll into view
+                loading_attrs = 'loading="eager" fetchpriority="high"' if index == 0 else 'loading="lazy" decoding="async"'
+                image_html = f'<img src="{image_src}" class="post-image" {loading_attrs} />'
         
         if not image_html:
             image_html = '<div class="no-image">No template available</div>'
         
-        # Format hashtags
-        hashtags_html = " ".join([f'<span class="hashtag">#{tag.replace("#", "")}</span>' for tag in hashtags[:8]])
-        
         # Create status message
         status_badge = f'🎭 Meme #{index + 1} | {category}'
         if is_tnglish:
@@ -375,99 +805,56 @@ class GradioMemeGenerator:
         
         # Related images (mini block)
         related_images_html = ""
-        related_images = self.find_related_images(index)
+        related_images = self.find_related_images(url)
         if related_images:
-            related_images_content = ""
-            for i, img_path in enumerate(related_images[:3]):  # Max 3 images
-                img = self.load_image_from_path(img_path)
-                if img:
-                    # Convert to base64 for display
-                    buffered = BytesIO()
-                    img.save(buffered, format="PNG")
-                    img_str = base64.b64encode(buffered.getvalue()).decode()
-                    related_images_content += f'<img src="data:image/png;base64,{img_str}" class="related-mini-image" alt="Related image {i+1}" />'
+            related_image_tags = []
+            thumbnail_paths = IMAGE_POOL.map(self.get_thumbnail_path, related_images[:3])  # Max 3 images
+            for i, thumb_path in enumerate(thumbnail_paths):
+                if thumb_path:
+                    # Browser fetches (and caches) the thumbnail file directly
+                    related_image_tags.append(f'<img src="{gradio_file_url(thumb_path)}" class="related-mini-image" width="80" height="80" loading="lazy" decoding="async" alt="Related image {i+1}" />')
+            related_images_content = "".join(related_image_tags)
             
             if related_images_content:
-                related_images_html = f"""
-                <div class="related-images-mini">
-                    <h4 class="related-title">📸 Related News Images</h4>
-                    <div class="mini-images-grid">
-                        {related_images_content}
-                    </div>
-                </div>
-                """
+                related_images_html = RELATED_IMAGES_TEMPLATE.format(related_images_content=related_images_content)
         
-        return f"""
-        <div class="meme-card">
-            <!-- Post Header -->
-            <div class="post-header">
-                <div class="profile-info">
-                    <div class="profile-avatar">🎭</div>
-                    <div>
-                        <div class="username">MemeGram</div>
-                        <div class="location">{status_badge}</div>
-                    </div>
-                </div>
-                <div class="menu-dots">⋯</div>
-            </div>
-            
-            <!-- 1. Main Image/Template -->
-            <div class="post-image-container">
-                {image_html}
-            </div>
-            
-            <!-- Post Actions -->
-            <div class="post-actions">
-                <div class="action-buttons">
-                    <span class="action-btn">❤️</span>
-                    <span class="action-btn">💬</span>
-                    <span class="action-btn">📤</span>
-                </div>
-                <div class="bookmark">🔖</div>
-            </div>
-            
-            <!-- 2. Description -->
-            <div class="post-content">
-                <div class="likes">❤️ {random.randint(100, 2000)} likes</div>
-                <div class="caption">
-                    <span class="username">memegram</span> 
-                    <span class="description-text">{description}</span>
-                </div>
-                
-                <!-- 3. Read More News Link -->
-                {f'<div class="news-link"><a href="{url}" target="_blank">🔗 Read full news article</a></div>' if url else ''}
-                
-                <!-- 4. Hashtags -->
-                <div class="hashtags">
-                    {hashtags_html}
-                </div>
-                
-                <!-- 5. Related Images Mini Block -->
-                {related_images_html}
-                
-                <!-- Timestamp -->
-                <div class="timestamp">{datetime.now().strftime('%B %d')} • See translation</div>
-            </div>
-        </div>
-        """
+        return MEME_CARD_TEMPLATE.format(
+            status_badge=status_badge,
+            image_html=image_html,
+            likes=meme_data['_likes'],
+            description_html=meme_data['_description_html'],
+            news_link_html=meme_data['_news_link_html'],
+            hashtags_html=meme_data['_hashtags_html'],
+            related_images_html=related_images_html,
+            timestamp=meme_data['_timestamp']
+        )
+    
+    def get_filtered_memes(self, selected_category="All"):
+        """Memes belonging to the selected category"""
+        if selected_category == "All":
+            return self.all_memes
+        return self.memes_by_category.get(selected_category, [])
+    
+    def has_more_memes(self):
+        """Whether the current category has cards beyond the visible page"""
+        return len(self.get_filtered_memes(self.current_category)) > self.visible_count
     
     def generate_all_memes_html(self, selected_category="All"):
-        """Generate all memes HTML based on selected category"""
+        """Visible page of memes HTML for a category, reused until the meme set changes"""
+        key = (selected_category, self.visible_count)
+        feed_html = self.feed_html_cache.get(key)
+        if feed_html is None:
+            feed_html = self.render_memes_html(selected_category)
+            self.feed_html_cache[key] = feed_html
+        return feed_html
+    
+    def render_memes_html(self, selected_category="All"):
+        """Generate the visible page of memes HTML based on selected category"""
         if not self.all_memes:
-            return """
-            <div class="empty-state">
-                <div style="text-align: center; padding: 4rem; color: #666;">
-                    <h3>No memes available</h3>
-                    <p>Click "🎭 Generate Memes" to start creating amazing content!</p>
-                </div>
-            </div>
-            """
+            return EMPTY_FEED_HTML
         
         # Filter memes by category
-        if selected_category == "All":
-            filtered_memes = self.all_memes
-        else:
-            filtered_memes = [meme for meme in self.all_memes if meme.get('category', '').title() == selected_category]
+        filtered_memes = self.get_filtered_memes(selected_category)
         
         if not filtered_memes:
             return f"""
@@ -479,98 +866,229 @@ class GradioMemeGenerator:
             </div>
             """
         
-        memes_html = ""
-        for index, meme_data in enumerate(filtered_memes):
-            memes_html += self.generate_meme_card_html(meme_data, index)
+        # Only mount the visible page of cards
+        visible_memes = filtered_memes[:self.visible_count]
+        self.prefetch_template_images(visible_memes)
+        # Cards render concurrently (PIL resize/encode release the GIL); map keeps feed order
+        memes_html = "".join(FETCH_POOL.map(
+            self.generate_meme_card_html, visible_memes, range(len(visible_memes))
+        ))
+        
+        count_label = f"{len(filtered_memes)} total"
+        if len(visible_memes) < len(filtered_memes):
+            count_label = f"showing {len(visible_memes)} of {len(filtered_memes)}"
         
         return f"""
         <div class="memes-grid">
             <div class="category-info">
-                <h2>📱 {selected_category} Memes ({len(filtered_memes)} total)</h2>
+                <h2>📱 {selected_category} Memes ({count_label})</h2>
             </div>
             {memes_html}
         </div>
         """
     
-    def generate_streaming_memes(self):
-        """Generate memes with status updates"""
+    def add_generated_meme(self, meme):
+        """Register a freshly processed meme with the feed, its category index and the radio choices"""
+        self.precompute_display_fields(meme)
+        self.all_memes.append(meme)
+        self.feed_html_cache.clear()
+        category = meme.get('category', 'Unknown').title()
+        if category not in self.memes_by_category:
+            self.memes_by_category[category] = []
+            self.available_categories = ["All"] + sorted(self.memes_by_category)
+        self.memes_by_category[category].append(meme)
+    
+    def process_articles_worker(self, results, progress):
+        """Run Gemini processing off the UI thread, queueing each meme as it completes (None marks the end)"""
+        try:
+            self.meme_processor.process_all_news_articles(
+                progress_cb=lambda fraction, message: progress(0.25 + fraction * 0.75, desc=message),
+                result_cb=results.put
+            )
+        except Exception as e:
+            print(f"Error processing articles: {e}")
+        finally:
+            results.put(None)
+    
+    def finish_generation(self, worker=None):
+        """Mark the run finished and free generation_lock, first waiting for its worker if one is still running"""
+        if worker is not None:
+            worker.join()
+        self.is_generating = False
+        self.generation_lock.release()
+    
+    def generate_streaming_memes(self, progress=gr.Progress()):
+        """Generate memes, streaming each card into the feed while later articles are still processing"""
+        # Ignore repeated clicks while a run is already scraping / calling Gemini
+        if not self.generation_lock.acquire(blocking=False):
+            yield (
+                self.generate_all_memes_html(self.current_category),
+                "⏳ Generation already in progress, please wait...",
+                gr.update()
+            )
+            return
+        
+        worker = None
         try:
             self.is_generating = True
             self.all_memes = []
-            self.available_categories = []
+            self.feed_html_cache.clear()
+            self.memes_by_category = {}
+            self.available_categories = ["All"]
             self.current_category = "All"
+            self.visible_count = MEMES_PAGE_SIZE
+            results = self.generation_queue = queue.Queue()
             
             # Step 1: Scrape news
-            categorized_news = self.news_extractor.get_all_news()
-            if not categorized_news:
-                self.is_generating = False
-                return (
+            progress(0, desc="📰 Scraping latest news...")
+            categorized_news = self.news_extractor.get_all_news(
+                progress_cb=lambda fraction, message: progress(fraction * 0.25, desc=f"📰 {message}")
+            )
+            if not categorized_news or not any(categorized_news.values()):
+                yield (
                     self.generate_all_memes_html(), 
                     "❌ Failed to scrape news",
                     gr.update(visible=False, choices=["All"], value="All")
                 )
+                return
             
-            self.categorized_news_data = categorized_news
+            # Only per-generation state is reset here; URL, decoded-image and
+            # thumbnail caches are keyed by path/mtime and stay valid across runs
+            self.build_related_images_index(categorized_news)
+            
+            # The processor reads the latest news JSON, so hand it this scrape
+            self.news_extractor.save_single_json_output(categorized_news)
+            
+            # Step 2: Process articles on a worker thread and render memes as they arrive
+            progress(0.25, desc="🤖 Processing articles with Gemini...")
+            # gr.Progress locates its event through context variables, which plain threads don't inherit
+            worker = threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(self.process_articles_worker, results, progress),
+                daemon=True
+            )
+            worker.start()
             
-            # Step 2: Process articles
-            processed_memes = self.meme_processor.process_all_news_articles()
-            if not processed_memes:
-                self.is_generating = False
-                return (
+            pending = False
+            last_yield = 0.0
+            shown_page = None
+            while True:
+                try:
+                    meme = results.get(timeout=STREAM_MIN_INTERVAL if pending else None)
+                    if meme is None:
+                        break
+                    self.add_generated_meme(meme)
+                    pending = True
+                except queue.Empty:
+                    pass
+                
+                # Coalesce bursts (e.g. cached articles) into at most one update per interval
+                if not pending or time.monotonic() - last_yield < STREAM_MIN_INTERVAL:
+                    continue
+                pending = False
+                last_yield = time.monotonic()
+                
+                # Memes past the visible page don't change the feed markup
+                page = (self.current_category, self.visible_count,
+                        min(len(self.get_filtered_memes(self.current_category)), self.visible_count))
+                feed_update = gr.update()
+                if page != shown_page:
+                    shown_page = page
+                    feed_update = self.generate_all_memes_html(self.current_category)
+                yield (
+                    feed_update,
+                    f"🎨 {len(self.all_memes)} memes ready, still processing...",
+                    gr.update(visible=self.has_category_choice(), choices=self.available_categories)
+                )
+            worker.join()
+            
+            if not self.all_memes:
+                yield (
                     self.generate_all_memes_html(), 
                     "❌ Failed to process articles",
                     gr.update(visible=False, choices=["All"], value="All")
                 )
+                return
             
-            self.all_memes = processed_memes
-            self.is_generating = False
-            
-            # Get available categories
-            categories = list(set([meme.get('category', 'Unknown').title() for meme in processed_memes]))
-            categories.sort()
-            self.available_categories = ["All"] + categories
-            
-            # Return all memes and show category buttons with updated choices
-            return (
-                self.generate_all_memes_html("All"), 
-                f"✅ Generated {len(processed_memes)} memes successfully across {len(categories)} categories!",
-                gr.update(visible=True, choices=self.available_categories, value="All")
+            # Final feed with the full count and category buttons
+            categories = self.available_categories[1:]
+            yield (
+                self.generate_all_memes_html(self.current_category), 
+                f"✅ Generated {len(self.all_memes)} memes successfully across {len(categories)} categories!",
+                gr.update(visible=self.has_category_choice(), choices=self.available_categories, value=self.current_category)
             )
                 
         except Exception as e:
-            self.is_generating = False
-            return (
+            yield (
                 self.generate_all_memes_html(), 
                 f"❌ Error: {str(e)}",
                 gr.update(visible=False, choices=["All"], value="All")
             )
+        finally:
+            # Release only after both this consumer and the worker are done; if the client disconnected
+            # mid-run, a helper waits for the worker so a second run can't start alongside it
+            if worker is not None and worker.is_alive():
+                threading.Thread(target=self.finish_generation, args=(worker,), daemon=True).start()
+            else:
+                self.finish_generation()
+            # Reclaim scrape/render scratch (PIL buffers, response bodies) once per run;
+            # a young-generation pass is enough and avoids a full gen-2 sweep
+            gc.collect(1)
     
     def filter_by_category(self, selected_category):
         """Filter memes by selected category"""
         self.current_category = selected_category
+        self.visible_count = MEMES_PAGE_SIZE
         return (
             self.generate_all_memes_html(selected_category),
             f"📱 Showing {selected_category} memes"
         )
+    
+    def show_more_memes(self):
+        """Reveal the next page of memes in the current category"""
+        self.visible_count += MEMES_PAGE_SIZE
+        return (
+            self.generate_all_memes_html(self.current_category),
+            f"📱 Showing more {self.current_category} memes"
+        )
+    
+    def has_category_choice(self):
+        """Category filter is only worth showing once memes span more than one category"""
+        return len(self.available_categories) > 2
+    
+    def show_more_button_update(self):
+        """Show the "Show More" button only while hidden cards remain"""
+        return gr.update(visible=self.has_more_memes())
 
 # Initialize the generator
 meme_generator = GradioMemeGenerator()
 
 # Instagram-style CSS with CLEAN HEADINGS and PROFESSIONAL BUTTONS
-instagram_css = """
+# Page chrome needed for first paint: header, generate button, filters, status, empty feed
+critical_css = """
 /* Instagram-inspired Design - ORANGISH RED & WHITE */
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
+/* Brand palette */
+:root {
+    --brand: #ff6b35;
+    --brand-dark: #e65100;
+    --brand-bg: #fff5f0;
+    --brand-border: #ffb399;
+    --brand-2: #ff8c42;
+    --title-size: 3rem;
+    --heading-2-size: 2rem;
+    --heading-3-size: 1.6rem;
+}
 
 .gradio-container {
     font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif !important;
-    background: linear-gradient(135deg, #fff5f0 0%, #fef7f0 100%) !important;
+    background: linear-gradient(135deg, var(--brand-bg) 0%, #fef7f0 100%) !important;
     min-height: 100vh;
     padding: 1rem;
 }
 
 /* Main Header - MemeGram Banner */
 .main-header {
-    background: linear-gradient(135deg, #ff6b35 0%, #ff8c42 100%);
+    background: linear-gradient(135deg, var(--brand) 0%, var(--brand-2) 100%);
     padding: 2rem;
     text-align: center;
     margin: 2rem auto;
@@ -590,7 +1108,7 @@ instagram_css = """
     cursor: pointer;
     margin: 2rem auto;
     max-width: 230px;
-    transition: all 0.3s ease-in-out;
+    transition: transform 0.3s ease-in-out, opacity 0.3s ease-in-out;
 }
 
 #generate-btn:hover {
@@ -599,7 +1117,7 @@ instagram_css = """
 }
 
 .main-title {
-    font-size: 3rem;
+    font-size: var(--title-size);
     font-weight: 800;
     margin: 0 0 0.5rem 0;
     text-shadow: 0 4px 20px rgba(0,0,0,0.3);
@@ -622,17 +1140,17 @@ instagram_css = """
 }
 
 .section-heading h2 {
-    font-size: 2rem;
+    font-size: var(--heading-2-size);
     font-weight: 700;
-    color: #ff6b35;
+    color: var(--brand);
     margin: 0;
     text-shadow: 0 2px 10px rgba(255, 107, 53, 0.1);
 }
 
 .section-heading h3 {
-    font-size: 1.6rem;
+    font-size: var(--heading-3-size);
     font-weight: 600;
-    color: #ff6b35;
+    color: var(--brand);
     margin: 0;
     text-shadow: 0 2px 10px rgba(255, 107, 53, 0.1);
 }
@@ -652,7 +1170,7 @@ instagram_css = """
 }
 
 .gradio-button {
-    background: linear-gradient(135deg, #ff6b35 0%, #ff8c42 100%) !important;
+    background: linear-gradient(135deg, var(--brand) 0%, var(--brand-2) 100%) !important;
     color: white !important;
     border: none !important;
     border-radius: 50px !important;                /* Rounded like Streamlit */
@@ -660,7 +1178,7 @@ instagram_css = """
     font-size: 1.3rem !important;                  /* Larger font */
     padding: 20px 50px !important;                 /* Bigger padding */
     cursor: pointer !important;
-    transition: all 0.4s ease !important;          /* Smooth animation */
+    transition: transform 0.4s ease, box-shadow 0.4s ease !important;  /* Gradient backgrounds swap instantly */
     min-height: 70px !important;                   /* Fixed height */
     min-width: 300px !important;                   /* Fixed width - won't expand */
     max-width: 300px !important;                   /* Maximum width limit */
@@ -676,7 +1194,7 @@ instagram_css = """
 }
 
 .gradio-button:hover {
-    background: linear-gradient(135deg, #ff8c42 0%, #ff6b35 100%) !important;
+    background: linear-gradient(135deg, var(--brand-2) 0%, var(--brand) 100%) !important;
     transform: translateY(-5px) scale(1.05) !important;  /* Lift and scale effect */
     box-shadow: 0 20px 50px rgba(255, 107, 53, 0.6) !important;
     color: white !important;
@@ -703,7 +1221,7 @@ instagram_css = """
     background: white !important;
     border-radius: 15px !important;
     box-shadow: 0 4px 15px rgba(255, 107, 53, 0.1) !important;
-    border: 2px solid #ffb399 !important;
+    border: 2px solid var(--brand-border) !important;
     max-width: 800px !important;
 }
 
@@ -717,14 +1235,14 @@ instagram_css = """
 }
 
 .gradio-radio label {
-    background: linear-gradient(135deg, #ff6b35 0%, #ff8c42 100%) !important;
-    border: 2px solid #ff8c42 !important;
+    background: linear-gradient(135deg, var(--brand) 0%, var(--brand-2) 100%) !important;
+    border: 2px solid var(--brand-2) !important;
     color: white !important;
     padding: 12px 24px !important;
     border-radius: 25px !important;
     font-weight: 700 !important;
     font-size: 0.95rem !important;
-    transition: all 0.3s ease !important;
+    transition: transform 0.3s ease, box-shadow 0.3s ease, border-color 0.3s ease !important;
     cursor: pointer !important;
     min-width: 100px !important;
     text-align: center !important;
@@ -734,17 +1252,17 @@ instagram_css = """
 }
 
 .gradio-radio label:hover {
-    background: linear-gradient(135deg, #ff5722 0%, #ff6b35 100%) !important;
+    background: linear-gradient(135deg, #ff5722 0%, var(--brand) 100%) !important;
     transform: translateY(-2px) !important;
     box-shadow: 0 6px 18px rgba(255, 107, 53, 0.4) !important;
     border-color: #ff5722 !important;
 }
 
 .gradio-radio input[type="radio"]:checked + label {
-    background: linear-gradient(135deg, #ff5722 0%, #e65100 100%) !important;
+    background: linear-gradient(135deg, #ff5722 0%, var(--brand-dark) 100%) !important;
     box-shadow: 0 6px 20px rgba(255, 87, 34, 0.5) !important;
     transform: translateY(-2px) !important;
-    border-color: #e65100 !important;
+    border-color: var(--brand-dark) !important;
 }
 
 .gradio-radio input[type="radio"] {
@@ -755,15 +1273,65 @@ instagram_css = """
 .status-message {
     text-align: center;
     padding: 12px 16px;
-    background: #fff5f0;
-    border: 2px solid #ffb399;
+    background: var(--brand-bg);
+    border: 2px solid var(--brand-border);
     border-radius: 12px;
     margin: 16px auto;
     max-width: 800px;
     font-weight: 600;
-    color: #ff6b35;
+    color: var(--brand);
 }
 
+/* Empty State */
+.empty-state {
+    background: white;
+    border: 2px solid var(--brand-border);  /* Changed border color */
+    border-radius: 15px;
+    margin: 2rem auto;
+    max-width: 614px;
+    box-shadow: 0 8px 25px rgba(255, 107, 53, 0.1);  /* Changed shadow */
+    overflow: hidden;
+    contain: content;
+}
+
+/* Mobile Responsive */
+@media (max-width: 768px) {
+    :root {
+        --title-size: 2rem;
+        --heading-2-size: 1.5rem;
+        --heading-3-size: 1.3rem;
+    }
+    
+    /* !important still needed: the desktop .gradio-radio/.form rules override Gradio's own with it */
+    .main-header,
+    .section-heading,
+    .gradio-radio,
+    .gradio-container .form,
+    .status-message {
+        margin: 1rem 8px !important;
+        max-width: calc(100% - 16px) !important;
+    }
+    
+    .main-header,
+    .section-heading {
+        padding: 1.5rem !important;
+    }
+    
+    .gradio-radio .gradio-checkboxgroup {
+        flex-direction: column !important;
+        gap: 8px !important;
+    }
+    
+    .gradio-radio label {
+        width: 100% !important;
+        max-width: 200px !important;
+    }
+}
+"""
+
+# Feed card styles; nothing uses them until memes are generated, so they load after first paint
+# from a cached external file (feed_stylesheet_head)
+feed_css = """
 /* Memes Grid */
 .memes-grid {
     max-width: 1200px;
@@ -772,7 +1340,7 @@ instagram_css = """
 }
 
 .category-info {
-    background: linear-gradient(135deg, #ff6b35 0%, #ff8c42 100%);
+    background: linear-gradient(135deg, var(--brand) 0%, var(--brand-2) 100%);
     color: white;
     padding: 1.5rem 2rem;
     border-radius: 15px;
@@ -791,19 +1359,23 @@ instagram_css = """
 /* Individual Meme Cards */
 .meme-card {
     background: white;
-    border: 2px solid #ffb399;
+    border: 2px solid var(--brand-border);
     border-radius: 15px;
     margin: 2rem auto;
     max-width: 614px;
     box-shadow: 0 8px 25px rgba(255, 107, 53, 0.1);
     overflow: hidden;
-    transition: all 0.3s ease;
+    transition: transform 0.3s ease, box-shadow 0.3s ease, border-color 0.3s ease;
+    /* Each card is self-contained: keep layout/paint work inside it and skip off-screen cards */
+    contain: content;
+    content-visibility: auto;
+    contain-intrinsic-size: auto 800px;
 }
 
 .meme-card:hover {
     transform: translateY(-5px);
     box-shadow: 0 15px 35px rgba(255, 107, 53, 0.2);
-    border-color: #ff6b35;
+    border-color: var(--brand);
 }
 
 /* Post Header - Fix text colors */
@@ -812,8 +1384,8 @@ instagram_css = """
     justify-content: space-between;
     align-items: center;
     padding: 16px;
-    border-bottom: 2px solid #fff5f0;
-    background: linear-gradient(135deg, #fff5f0 0%, #fef7f0 100%);
+    border-bottom: 2px solid var(--brand-bg);
+    background: var(--brand-bg);
 }
 
 .profile-info {
@@ -825,32 +1397,30 @@ instagram_css = """
     width: 32px;
     height: 32px;
     border-radius: 50%;
-    background: linear-gradient(135deg, #ff6b35 0%, #ff8c42 100%);  /* Changed to orangish-red */
+    background: var(--brand);  /* Flat fill: repeated on every card, the shadow stays on the card itself */
     display: flex;
     align-items: center;
     justify-content: center;
     margin-right: 12px;
     font-size: 16px;
     color: white;
-    box-shadow: 0 4px 12px rgba(255, 107, 53, 0.3);  /* Changed shadow color */
 }
 
 .username {
     font-weight: 600;
     font-size: 14px;
-    color: #ff6b35;  /* Changed to orangish-red */
+    color: var(--brand);  /* Changed to orangish-red */
 }
 
 .location {
     font-size: 12px;
-    color: #e65100;  /* Changed to darker orangish-red */
+    color: var(--brand-dark);  /* Changed to darker orangish-red */
     margin-top: 2px;
 }
 
 .menu-dots {
     font-size: 16px;
-    cursor: pointer;
-    color: #ff6b35;  /* Changed to orangish-red */
+    color: var(--brand);  /* Changed to orangish-red */
 }
 
 /* Post Image */
@@ -858,6 +1428,7 @@ instagram_css = """
     position: relative;
     width: 100%;
     background: #000;
+    contain: content;
 }
 
 .post-image {
@@ -871,13 +1442,14 @@ instagram_css = """
 .no-image {
     width: 100%;
     height: 300px;
-    background: #fff5f0;
+    background: var(--brand-bg);
     display: flex;
     align-items: center;
     justify-content: center;
-    color: #ff6b35;
+    color: var(--brand);
     font-size: 16px;
     font-weight: 500;
+    contain: strict;
 }
 
 /* Post Actions */
@@ -894,11 +1466,15 @@ instagram_css = """
     gap: 16px;
 }
 
+.action-btn,
+.menu-dots {
+    cursor: pointer;
+}
+
 .action-btn {
     font-size: 24px;
-    cursor: pointer;
     user-select: none;
-    transition: all 0.2s ease;
+    transition: transform 0.2s ease, opacity 0.2s ease;
 }
 
 .action-btn:hover {
@@ -907,9 +1483,7 @@ instagram_css = """
 }
 
 .bookmark {
-    font-size: 24px;
-    cursor: pointer;
-    color: #ff6b35;  /* Changed to orangish-red */
+    color: var(--brand);  /* Changed to orangish-red */
 }
 
 /* Post Content - Fix text colors */
@@ -922,7 +1496,7 @@ instagram_css = """
     font-weight: 600;
     font-size: 14px;
     margin-bottom: 8px;
-    color: #ff6b35;  /* Changed to orangish-red */
+    color: var(--brand);  /* Changed to orangish-red */
 }
 
 .caption {
@@ -934,7 +1508,7 @@ instagram_css = """
 .caption .username {
     font-weight: 600;
     margin-right: 8px;
-    color: #ff6b35;  /* Changed to orangish-red */
+    color: var(--brand);  /* Changed to orangish-red */
 }
 
 .description-text {
@@ -946,10 +1520,9 @@ instagram_css = """
 .news-link {
     margin: 12px 0;
     padding: 12px;
-    background: linear-gradient(135deg, #ff6b35 0%, #ff8c42 100%);  /* Changed to orangish-red */
+    background: #ff7a3a;  /* Solid midpoint of the brand gradient; one per card, so keep paint cheap */
     border-radius: 8px;
     text-align: center;
-    box-shadow: 0 4px 15px rgba(255, 107, 53, 0.3);  /* Changed shadow */
 }
 
 .news-link a {
@@ -970,8 +1543,8 @@ instagram_css = """
 }
 
 .hashtag {
-    color: #ff6b35;  /* Changed to orangish-red */
-    background: #fff5f0;  /* Light orangish background */
+    color: var(--brand);  /* Changed to orangish-red */
+    background: var(--brand-bg);  /* Light orangish background */
     padding: 4px 8px;
     border-radius: 12px;
     font-weight: 600;
@@ -980,12 +1553,12 @@ instagram_css = """
     cursor: pointer;
     font-size: 13px;
     display: inline-block;
-    border: 1px solid #ffb399;  /* Changed border color */
-    transition: all 0.2s ease;
+    border: 1px solid var(--brand-border);  /* Changed border color */
+    transition: background-color 0.15s ease, color 0.15s ease;
 }
 
 .hashtag:hover {
-    background: #ff6b35;  /* Changed to orangish-red */
+    background: var(--brand);  /* Changed to orangish-red */
     color: white;
 }
 
@@ -993,17 +1566,23 @@ instagram_css = """
 .related-images-mini {
     margin: 16px 0;
     padding: 12px;
-    background: #fff5f0;  /* Light orangish background */
+    background: var(--brand-bg);  /* Light orangish background */
     border-radius: 12px;
-    border: 2px solid #ffb399;  /* Changed border color */
+    border: 2px solid var(--brand-border);  /* Changed border color */
+    contain: content;
 }
 
 .related-title {
-    margin: 0 0 10px 0;
+    margin: 0;
     font-size: 13px;
     font-weight: 600;
-    color: #ff6b35;  /* Changed to orangish-red */
+    color: var(--brand);  /* Changed to orangish-red */
     text-align: center;
+    cursor: pointer;
+}
+
+.related-images-mini[open] .related-title {
+    margin-bottom: 10px;
 }
 
 .mini-images-grid {
@@ -1018,34 +1597,24 @@ instagram_css = """
     height: 80px;
     object-fit: cover;
     border-radius: 8px;
-    border: 1px solid #ffb399;  /* Changed border color */
-    transition: all 0.2s ease;
+    border: 1px solid var(--brand-border);  /* Changed border color */
+    transition: transform 0.2s ease, border-color 0.2s ease;
+    contain: strict;
 }
 
 .related-mini-image:hover {
     transform: scale(1.05);
-    border-color: #ff6b35;  /* Changed to orangish-red */
+    border-color: var(--brand);  /* Changed to orangish-red */
 }
 
 /* Timestamp */
 .timestamp {
     font-size: 12px;
-    color: #e65100;  /* Changed to darker orangish-red */
+    color: var(--brand-dark);  /* Changed to darker orangish-red */
     text-transform: uppercase;
     margin-top: 16px;
 }
 
-/* Empty State */
-.empty-state {
-    background: white;
-    border: 2px solid #ffb399;  /* Changed border color */
-    border-radius: 15px;
-    margin: 2rem auto;
-    max-width: 614px;
-    box-shadow: 0 8px 25px rgba(255, 107, 53, 0.1);  /* Changed shadow */
-    overflow: hidden;
-}
-
 /* Mobile Responsive */
 @media (max-width: 768px) {
     .meme-card {
@@ -1053,40 +1622,6 @@ instagram_css = """
         max-width: calc(100% - 16px);
     }
     
-    .main-header,
-    .section-heading {
-        margin: 1rem 8px !important;
-        max-width: calc(100% - 16px) !important;
-        padding: 1.5rem !important;
-    }
-    
-    .main-title {
-        font-size: 2rem;
-    }
-    
-    .section-heading h2 {
-        font-size: 1.5rem;
-    }
-    
-    .section-heading h3 {
-        font-size: 1.3rem;
-    }
-    
-    .gradio-radio, .gradio-container .form {
-        margin: 1rem 8px !important;
-        max-width: calc(100% - 16px) !important;
-    }
-    
-    .gradio-radio .gradio-checkboxgroup {
-        flex-direction: column !important;
-        gap: 8px !important;
-    }
-    
-    .gradio-radio label {
-        width: 100% !important;
-        max-width: 200px !important;
-    }
-    
     .mini-images-grid {
         gap: 6px;
     }
@@ -1095,47 +1630,55 @@ instagram_css = """
         width: 60px;
         height: 60px;
     }
-    
-    .status-message {
-        margin: 16px 8px !important;
-        max-width: calc(100% - 16px) !important;
-    }
 }
 """
 
+# Ship both stylesheets minified; the source above stays readable
+critical_css = _minify_css(critical_css)
+feed_css = _minify_css(feed_css)
+
+def feed_stylesheet_head():
+    """Write feed_css to a content-hashed file and return the <head> markup that loads it without blocking"""
+    css_hash = hashlib.md5(feed_css.encode()).hexdigest()[:10]
+    css_path = STATIC_DIR / f"memegram.{css_hash}.css"
+    if not css_path.exists():
+        STATIC_DIR.mkdir(parents=True, exist_ok=True)
+        css_path.write_text(feed_css, encoding='utf-8')
+    
+    # New content means a new filename, so browsers can keep a cached copy indefinitely
+    css_url = gradio_file_url(css_path)
+    return (
+        f'<link rel="preload" as="style" href="{css_url}" onload="this.onload=null;this.rel=\'stylesheet\'">'
+        f'<noscript><link rel="stylesheet" href="{css_url}"></noscript>'
+    )
+
+# Inter comes in through the theme's font loading (display=swap) instead of a render-blocking
+# @import; the unused monospace web font is swapped for system fonts
+memegram_theme = gr.themes.Soft(
+    font=[gr.themes.GoogleFont("Inter", weights=(400, 500, 600, 700, 800)), "-apple-system", "BlinkMacSystemFont", "Segoe UI", "Roboto", "sans-serif"],
+    font_mono=["ui-monospace", "SFMono-Regular", "Consolas", "monospace"]
+)
+
 # Create the Gradio interface
 def create_interface():
-    with gr.Blocks(css=instagram_css, title="📱 MemeGram - Instagram Style", theme=gr.themes.Soft()) as demo:
+    with gr.Blocks(css=critical_css, head=feed_stylesheet_head(), title="📱 MemeGram - Instagram Style", theme=memegram_theme) as demo:
         
         # Main Header - MemeGram Banner (unchanged)
-        gr.HTML("""
-        <div class="main-header">
-            <h1 class="main-title">📱 MemeGram</h1>
-            <p class="main-subtitle">AI-powered viral memes from latest Indian news</p>
-        </div>
-        """)
+        gr.HTML(MAIN_HEADER_HTML)
         
         # SIMPLE HEADING: Generate Your Viral Content
-        gr.HTML("""
-        <div class="section-heading">
-            <h2>🚀 Generate Your Viral Content</h2>
-        </div>
-        """)
+        gr.HTML(GENERATE_HEADING_HTML)
         
         generate_btn = gr.Button("🎭 Generate Memes",elem_id="generate-btn")
         
         # Status Message
         status_display = gr.HTML(
-            value='<div class="status-message">🎯 Ready to generate amazing Instagram-style memes!</div>',
+            value=READY_STATUS_HTML,
             show_label=False
         )
         
         # SIMPLE HEADING: Filter by Category
-        gr.HTML("""
-        <div class="section-heading">
-            <h3>📂 Filter by Category</h3>
-        </div>
-        """)
+        gr.HTML(FILTER_HEADING_HTML)
         
         category_radio = gr.Radio(
             choices=["All"],
@@ -1151,16 +1694,43 @@ def create_interface():
             show_label=False
         )
         
-        # Event handlers
+        show_more_btn = gr.Button("⬇️ Show More Memes", visible=False)
+        
+        # Event handlers - button stays disabled while a generation run is in flight
         generate_btn.click(
+            fn=lambda: gr.update(interactive=False),
+            outputs=[generate_btn],
+            queue=False
+        ).then(
             fn=meme_generator.generate_streaming_memes,
             outputs=[memes_display, status_display, category_radio]
+        ).then(
+            fn=lambda: gr.update(interactive=True),
+            outputs=[generate_btn],
+            queue=False
+        ).then(
+            fn=meme_generator.show_more_button_update,
+            outputs=[show_more_btn],
+            queue=False
         )
         
         category_radio.change(
             fn=meme_generator.filter_by_category,
             inputs=[category_radio],
             outputs=[memes_display, status_display]
+        ).then(
+            fn=meme_generator.show_more_button_update,
+            outputs=[show_more_btn],
+            queue=False
+        )
+        
+        show_more_btn.click(
+            fn=meme_generator.show_more_memes,
+            outputs=[memes_display, status_display]
+        ).then(
+            fn=meme_generator.show_more_button_update,
+            outputs=[show_more_btn],
+            queue=False
         )
     
     return demo
@@ -1173,5 +1743,6 @@ if __name__ == "__main__":
         server_port=7860,
         share=True,
         show_error=True,
+        allowed_paths=[str(THUMBNAIL_DIR), str(MEMES_DIR), str(STATIC_DIR)],
         debug=True
     )